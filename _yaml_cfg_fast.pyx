@@ -0,0 +1,77 @@
+# cython: language_level=3
+"""
+YamlConfigurator字典合并的Cython实现，行为与yaml_configurator中的纯Python实现一致。
+[Cython implementation of the YamlConfigurator dictionary merge, behaving the same as the pure-Python one.]
+
+构建 [Build]:
+    cythonize -i _yaml_cfg_fast.pyx
+"""
+
+
+cpdef dict recursive_update(dict original_dict, object new_dict, bint append_list=False):
+    """
+    递归更新字典。 [Recursively update dictionary.]
+
+    与纯Python实现一样使用显式栈，嵌套很深的输入也不会耗尽C栈。
+    [Uses an explicit stack like the pure-Python implementation, so deeply nested input cannot exhaust the C stack.]
+    """
+    # active记录当前栈上新字典的id，用于发现循环引用(如YAML递归锚点)。
+    # [active holds the ids of the new dicts currently on the stack, to detect cycles such as recursive YAML anchors.]
+    cdef list stack = [(original_dict, iter(new_dict.items()), id(new_dict))]
+    cdef set active = {id(new_dict)}
+    cdef dict target
+    cdef object items, key, value, child
+    while stack:
+        target, items, _ = <tuple>stack[-1]
+        for key, value in items:
+            # 新字典来自调用方，可能是OrderedDict等子类，因此用isinstance判断。
+            # [new_dict comes from the caller and may hold subclasses such as OrderedDict, hence isinstance.]
+            if isinstance(value, dict):
+                # 如果target中没有key或者key对应的值不是字典类型，则将key对应的值设为空字典。
+                # [if target does not have key or key value is not a dictionary type, set key value to empty dictionary.]
+                if id(value) in active:
+                    raise ValueError(f'Circular reference in the data to update, key: {key}.')
+                child = target.get(key)
+                if type(child) is not dict:
+                    child = {}
+                    target[key] = child
+                stack.append((child, iter(value.items()), id(value)))
+                active.add(id(value))
+                break
+            elif append_list and isinstance(value, list):
+                # 如果target中没有key或者key对应的值不是列表类型，则将key对应的值设为空列表。
+                # [if target does not have key or key value is not a list type, set key value to empty list.]
+                child = target.get(key)
+                if type(child) is not list:
+                    child = []
+                    target[key] = child
+                append_list_items(<list>child, value)
+            else:
+                target[key] = value
+        else:
+            active.discard((<tuple>stack.pop())[2])
+
+    return original_dict
+
+
+cpdef append_list_items(list original_list, object new_items):
+    """
+    将新项追加到原始列表中，字典项会被递归复制。 [Append new items to the original list, dictionary items are copied recursively.]
+    """
+    cdef object item
+    cdef dict child
+    for item in new_items:
+        if isinstance(item, dict):
+            break
+    else:
+        # 没有字典项时整体追加。 [Without dictionary items, extend the list in one go.]
+        original_list.extend(new_items)
+        return
+
+    for item in new_items:
+        if isinstance(item, dict):
+            child = {}
+            original_list.append(child)
+            recursive_update(child, item, False)
+        else:
+            original_list.append(item)
@@ -31,7 +31,7 @@ Examples:
     >>> # 1. 创建一个YAML文件('ignore_exists'忽略存在的文件并覆盖)。 [Create a YAML file ('ignore_exists' ignores existing files and overrides).]
     >>> obj = YamlConfigurator(file_path='config.yaml')
     >>> obj.create({'key1': {'sub_key1': 'value11'}, 'key2': 'value2'}, ignore_exists=True)
-    >>> obj.data
+    >>> obj.data_copy()
     {'key1': {'sub_key1': 'value11'}, 'key2': 'value2'}
     >>> # 2.1 加载一个YAML文件。 [Load a YAML file.]
     >>> obj = YamlConfigurator(file_path='config.yaml').safe_load()
@@ -46,11 +46,11 @@ Examples:
     'default_value'
     >>> # 2.5 覆盖更新YAML文件中键的值 (key: key1)。 [Overwrite the value of a key in the YAML file.]
     >>> obj.update({'key1': {'sub_key1': ['value11', 'value12'], 'sub_key2': 'value21'}})
-    >>> obj.data
+    >>> obj.data_copy()
     {'key1': {'sub_key1': ['value11', 'value12'], 'sub_key2': 'value21'}, 'key2': 'value2'}
     >>> # 2.6 追加更新YAML文件中键的列表 (key: key1 - sub_key)。 [Append update the list of a key in the YAML file.]
     >>> obj.update({'key1': {'sub_key1': ['value13']}, 'key3': 'value3'}, append_list=True)
-    >>> obj.data
+    >>> obj.data_copy()
     {'key1': {'sub_key1': ['value11', 'value12', 'value13'], 'sub_key2': 'value21'}, 'key2': 'value2', 'key3': 'value3'}
     >>> # 2.7.1 获取多个已存在键的值，且有的存在同一父源 (keys: key1 - sub_key1, key1 - sub_key2, key2)。
     >>> # [Get the values of multiple existing keys, and some exist in the same parent source.]
@@ -60,12 +60,227 @@ Examples:
     >>> (sub_key1, sub_key2), key2 = obj.gets(['key1', ['sub_key1', 'sub_key2']], 'key2')
     >>> sub_key1, sub_key2, key2
     (['value11', 'value12', 'value13'], 'value21', 'value2')
+    >>> # 2.8 使用点分隔的键路径，预先拆分后可重复使用。 [Use a dotted key path, split once and reused.]
+    >>> sub_key2_path = YamlConfigurator.path('key1.sub_key2')
+    >>> obj.get(sub_key2_path)
+    'value21'
 """
+import copy
+import hashlib
+import json
 import os
-from typing import Any, Dict, List, Optional, Union
+import pickle
+import stat
+import sys
+import threading
+import types
+import uuid
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 import yaml
 
+try:
+    # 优先使用libyaml的C实现，速度更快。 [Prefer the libyaml-backed C implementation, which is much faster.]
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    # 可选的Cython字典合并实现(见_yaml_cfg_fast.pyx)。 [Optional Cython dictionary merge (see _yaml_cfg_fast.pyx).]
+    from _yaml_cfg_fast import recursive_update as _fast_recursive_update
+except ImportError:
+    _fast_recursive_update = None
+
+# 导入时确定一次加载/写入配置，各调用复用。 [Loader/dumper settings resolved once at import time and reused by every call.]
+_DUMP_OPTIONS = {'Dumper': SafeDumper, 'default_flow_style': False, 'allow_unicode': True}
+
+
+def _yaml_load(stream) -> Any:
+    """
+    使用模块级加载器解析 YAML。 [Parse YAML with the module-level loader.]
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _yaml_dump(data: Any, stream) -> None:
+    """
+    使用模块级写入器序列化 YAML。 [Serialize YAML with the module-level dumper.]
+    """
+    yaml.dump(data, stream, **_DUMP_OPTIONS)
+
+
+def _fingerprint(data: Any) -> bytes:
+    """
+    计算数据的内容指纹，用于判断数据是否变化。 [Compute a content fingerprint of the data, used to detect changes.]
+    """
+    return hashlib.blake2b(pickle.dumps(data, protocol=5), digest_size=16).digest()
+
+
+def _create_temp_file(target: str) -> tuple:
+    """
+    在目标文件所在目录中创建唯一的临时文件，权限为0o666并由内核应用当前umask，与open()创建文件时一致。
+    [Create a unique temporary file next to the target. It is created with mode 0o666 and the kernel applies
+     the current umask, the same as open() would.]
+
+    :return: (文件描述符, 临时文件路径)。 [(file descriptor, temporary file path).]
+    """
+    directory, name = os.path.split(target)
+    while True:
+        tmp_path = os.path.join(directory, f'.{name}.{uuid.uuid4().hex[:8]}.tmp')
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+# 键不存在时的哨兵值。 [Sentinel for missing keys.]
+_MISSING = object()
+
+
+class KeyPath(tuple):
+    """
+    由YamlConfigurator.path生成的键路径。get/gets只把这种类型视为完整的键路径，普通元组仍作为单个键。
+    [Key path produced by YamlConfigurator.path. get/gets only treat this type as a whole key path;
+     plain tuples are still looked up as a single key.]
+    """
+    __slots__ = ()
+
+
+@lru_cache(maxsize=256)
+def _split_path(dotted: str) -> KeyPath:
+    """
+    拆分点分隔的键路径并驻留各个键。 [Split a dotted key path and intern each key.]
+    """
+    return KeyPath(map(sys.intern, dotted.split('.')))
+
+
+def _intern_keys(data: Any) -> Any:
+    """
+    原地驻留所有字典中的字符串键，使之后的键查找可以走同一对象的快速比较。
+    [Intern all string dict keys in place, so later key lookups hit the identity fast path.]
+
+    原地修改可保留YAML锚点产生的共享对象，已访问的对象会被跳过，支持循环引用。
+    [Working in place keeps objects shared through YAML anchors; visited objects are skipped, so cycles are fine.]
+    """
+    stack = [data]
+    seen = set()
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if type(obj) is dict:
+            items = [(sys.intern(k) if type(k) is str else k, v) for k, v in obj.items()]
+            obj.clear()
+            obj.update(items)
+            values = obj.values()
+        elif type(obj) is list:
+            values = obj
+        else:
+            continue
+        stack.extend(v for v in values if type(v) is dict or type(v) is list)
+
+    return data
+
+
+# JSON缓存文件的后缀，解析JSON比解析YAML快得多。 [Suffix of the JSON cache file; JSON parses much faster than YAML.]
+_CACHE_FILE_SUFFIX = '.cache.json'
+
+
+def _read_cache_file(cache_path: str, stat_key: List) -> Any:
+    """
+    读取JSON缓存文件，仅当其记录的YAML文件inode、ctime、修改时间和大小与当前一致时有效。
+    [Read the JSON cache file; it is only valid if the recorded inode, ctime, mtime and size of the YAML file
+     still match.]
+
+    :param stat_key: YAML文件的[inode, ctime_ns, mtime_ns, size]。 [[inode, ctime_ns, mtime_ns, size] of the YAML file.]
+    :return: 缓存的数据，无效或读取失败时返回_MISSING。 [Cached data, or _MISSING if invalid or unreadable.]
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return _MISSING
+
+    if type(cache) is not dict or cache.get('stat') != stat_key or 'data' not in cache:
+        return _MISSING
+    return cache['data']
+
+
+def _write_cache_file(cache_path: str, stat_key: List, data: Any) -> None:
+    """
+    尽力写入JSON缓存文件。数据经JSON往返后不变(如不含日期、非字符串键)时才写入。
+    [Best-effort write of the JSON cache file. Only written if the data survives a JSON round trip unchanged
+     (e.g. no dates or non-string keys).]
+    """
+    try:
+        text = json.dumps({'stat': stat_key, 'data': data}, ensure_ascii=False)
+        if json.loads(text)['data'] != data:
+            return
+        with open(cache_path, 'w', encoding='utf-8') as file:
+            file.write(text)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+# 解析结果缓存，每个绝对路径只保留一项，最多保留_PARSE_CACHE_SIZE个路径。
+# [Parse result cache with a single entry per absolute path, holding at most _PARSE_CACHE_SIZE paths.]
+_PARSE_CACHE_SIZE = 128
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _parse_file(file_path: str, stat_key: List, cache_file: bool) -> Any:
+    """
+    解析YAML文件，可选地读写文件旁的JSON缓存文件。 [Parse the YAML file, optionally reading/writing the JSON cache file next to it.]
+    """
+    if cache_file:
+        data = _read_cache_file(file_path + _CACHE_FILE_SUFFIX, stat_key)
+        if data is not _MISSING:
+            return _intern_keys(data)
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        data = _intern_keys(_yaml_load(file))
+
+    if cache_file:
+        _write_cache_file(file_path + _CACHE_FILE_SUFFIX, stat_key, data)
+    return data
+
+
+def _cached_load(file_path: str, stat_key: List, cache_file: bool = False) -> Any:
+    """
+    缓存解析结果，文件的inode、ctime、修改时间或大小变化时自动失效，并替换该路径的旧缓存项。
+    ctime无法通过utime回拨，因此保留修改时间的复制、恢复也会使缓存失效。
+    [Cache parse results; an entry is invalidated when the file's inode, ctime, mtime or size changes, and is then
+     replaced by the new result for that path. ctime cannot be set back with utime, so copies and restores that
+     preserve the mtime also invalidate the cache.]
+
+    返回的对象是共享的，调用方不能直接修改。 [The returned object is shared, callers must not mutate it.]
+
+    :param file_path: 绝对路径。 [Absolute path.]
+    :param stat_key: 文件的[inode, ctime_ns, mtime_ns, size]。 [[inode, ctime_ns, mtime_ns, size] of the file.]
+    :param cache_file: 是否使用文件旁的JSON缓存文件，以便跨进程复用解析结果。
+     [Whether to use a JSON cache file next to the file, so parse results are reused across processes.]
+    """
+    with _PARSE_CACHE_LOCK:
+        entry = _PARSE_CACHE.get(file_path)
+        if entry is not None and entry[0] == stat_key:
+            _PARSE_CACHE.move_to_end(file_path)
+            return entry[1]
+
+    data = _parse_file(file_path, stat_key, cache_file)
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[file_path] = (stat_key, data)
+        _PARSE_CACHE.move_to_end(file_path)
+        while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return data
+
 
 class YamlConfigurator:
     """
@@ -76,9 +291,13 @@ class YamlConfigurator:
         data: 配置数据。 [YAML file data, default: None.]
     """
 
+    __slots__ = ('file_path', '_data', '_last_hash', '__weakref__')
+
     def __init__(self, file_path: Optional[str] = None, data: Optional[Dict] = None):
         self.file_path = file_path
         self._data = data
+        # 本对象最后一次写入文件的数据指纹，未知时为None。 [Fingerprint of the data last written by this object, None if unknown.]
+        self._last_hash = None
 
     def __str__(self):
         return os.path.basename(self.file_path) if self.file_path is not None else ''
@@ -88,51 +307,153 @@ class YamlConfigurator:
         """
         写入 YAML 文件。 [Write to YAML file.]
         """
-        if os.path.exists(file_path) and create:
-            raise FileExistsError(f'The file already exists: {file_path}')
+        # 写入符号链接指向的真实文件，而不是替换链接本身。 [Write through symlinks instead of replacing the link itself.]
+        target = os.path.realpath(file_path)
+
+        if create:
+            # 以'x'模式原子地占用文件路径，避免先检查再写入的竞争。
+            # [Atomically claim the path with mode 'x', avoiding the race between checking and writing.]
+            try:
+                open(target, 'x').close()
+            except FileExistsError:
+                raise FileExistsError(f'The file already exists: {file_path}') from None
+            mode = None
+        else:
+            # 覆盖已有文件时保留其权限；新文件由内核按当前umask设置权限。
+            # [Keep the permissions of an existing file; for a new file the kernel applies the current umask.]
+            try:
+                mode = stat.S_IMODE(os.stat(target).st_mode)
+            except FileNotFoundError:
+                mode = None
+
+        # 先写入同目录下的临时文件，再原子替换，避免写入中途失败导致配置文件损坏。
+        # [Write to a temporary file in the same directory, then atomically replace the target,
+        #  so a failure mid-write never leaves a corrupt config file.]
+        tmp_path = None
+        try:
+            fd, tmp_path = _create_temp_file(target)
+            with open(fd, 'w', encoding='utf-8') as file:
+                _yaml_dump(data, file)
+                file.flush()
+                os.fsync(file.fileno())
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            # 清理临时文件，以及创建时占用的空文件。 [Clean up the temporary file and the empty file claimed on create.]
+            for path in (tmp_path, target if create else None):
+                if path is not None:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            raise
+
+        # 删除已过期的JSON缓存文件。 [Remove the now stale JSON cache file.]
+        try:
+            os.remove(file_path + _CACHE_FILE_SUFFIX)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _get_one(data: Any, keys: tuple, sentinel: Any) -> Any:
+        """
+        依次访问键获取嵌套值。 [Walk the keys to get a nested value.]
 
-        # yaml = YAML(typ='safe')
-        with open(file_path, 'w', encoding='utf-8') as file:
-            yaml.dump(data, file)
+        :param data: 要访问的数据。 [Data to walk.]
+        :param keys: 键元组。 [Tuple of keys.]
+        :param sentinel: 键不存在时的返回值。 [Value returned when a key is missing.]
+        :return: 嵌套值，不存在则返回sentinel。 [The nested value, or sentinel if it does not exist.]
+        """
+        try:
+            for key in keys:
+                data = data[key]
+        except (KeyError, TypeError):
+            return sentinel
+        return data
+
+    @staticmethod
+    def _missing_path(data: Any, keys: tuple, parent_args: tuple) -> List:
+        """
+        重新访问一次，找出缺失的键路径(仅在出错时调用)。
+        [Walk again to find the missing key path (only called on a miss).]
+
+        :raises ValueError: 只允许最后一个参数为列表。 [Only the last parameter is allowed to be a list.]
+        """
+        for i, key in enumerate(keys):
+            if isinstance(key, list):
+                raise ValueError(f'Only the last parameter can be a list: {key}.')
+            try:
+                data = data[key]
+            except (KeyError, TypeError):
+                return list(parent_args + keys[:i + 1])
+        return list(parent_args + keys)
+
+    @classmethod
+    def _missing(cls, data: Any, keys: tuple, parent_args: tuple, has_default: bool, default: Any) -> Any:
+        """
+        键路径缺失时返回默认值，若无默认值则抛出异常。 [Return the default for a missing key path, or raise if there is none.]
+
+        :raises KeyError: 配置参数缺失。 [Missing configuration parameters.]
+        :raises ValueError: 只允许最后一个参数为列表。 [Only the last parameter is allowed to be a list.]
+        """
+        if has_default:
+            # 键中含有列表时仍需重新访问：列表出现在缺失的键之前时应抛出ValueError，而不是返回默认值。
+            # [Keys containing a list still need the re-walk: if the list comes before the missing key,
+            #  a ValueError is raised instead of returning the default.]
+            for key in keys:
+                if isinstance(key, list):
+                    break
+            else:
+                return default
+
+        path = cls._missing_path(data, keys, parent_args)
+        if has_default:
+            return default
+        raise KeyError(f'Missing configuration parameters: {path}.')
 
     @classmethod
-    def __get(cls, *args: Union[str, List[str]], data: Dict, parent_args: Optional[List] = None, **kwargs) -> Any:
+    def __get(cls, data: Dict, args: tuple, parent_args: tuple, has_default: bool, default: Any) -> Any:
         """
         获取子值。 [Get child value.]
 
-        :param args: YAML对象的键，用于访问嵌套值。 [Keys of the YAML object, used to access nested values.]
         :param data: 深度拷贝后的字典对象。 [Deep copy of the dictionary object.]
+        :param args: YAML对象的键，用于访问嵌套值。 [Keys of the YAML object, used to access nested values.]
+        :param parent_args: 父级键，仅用于错误信息。 [Parent keys, only used in error messages.]
         :param has_default: 是否存在默认值。 [Whether there is a default value.]
+        :param default: 默认值。 [Default value.]
         :return: 子值的值，如果不存在则返回默认值，若无默认值则抛出异常。 [The value of the child value, if it does not exist, return the default value, otherwise throw an exception.]
         :raises KeyError: 配置参数缺失。 [Missing configuration parameters.]
         :raises ValueError: 只允许最后一个参数为列表。 [Only the last parameter is allowed to be a list.]
         """
-        has_default = 'default' in kwargs
-        default = kwargs.get('default')
-
-        exists_args = [] if not parent_args else parent_args.copy()
-        for i, arg in enumerate(args):
-            # 仅最后一个参数可以是列表，且该列表中的元素用于访问多个子键。 [This is to allow fetching multiple keys in a single operation.]
-            if isinstance(arg, list):
-                if i != len(args) - 1:
-                    raise ValueError(f'Only the last parameter can be a list: {arg}.')
-
-                results = []
-                for a in arg:
-                    results.append(cls.__get(a, data=data, parent_args=exists_args, **kwargs))
-                return results
-
-            else:
-                exists_args.append(arg)
-                try:
-                    data = data[arg]
-                except (KeyError, TypeError):
-                    if has_default:
-                        return default
-
-                    raise KeyError(f'Missing configuration parameters: {exists_args}.')
-
-        return data
+        # 仅最后一个参数可以是列表，且该列表中的元素用于访问多个子键。 [This is to allow fetching multiple keys in a single operation.]
+        sub_keys = None
+        if args and isinstance(args[-1], list):
+            args, sub_keys = args[:-1], args[-1]
+
+        value = cls._get_one(data, args, _MISSING)
+        if value is _MISSING:
+            return cls._missing(data, args, parent_args, has_default, default)
+
+        if sub_keys is None:
+            return value
+
+        data = value
+
+        prefix = parent_args + args
+        results = [None] * len(sub_keys)
+        for i, a in enumerate(sub_keys):
+            if isinstance(a, list):
+                results[i] = cls.__get(data, (a,), prefix, has_default, default)
+                continue
+
+            value = cls._get_one(data, (a,), _MISSING)
+            if value is _MISSING:
+                if not has_default:
+                    raise KeyError(f'Missing configuration parameters: {list(prefix + (a,))}.')
+                value = default
+            results[i] = value
+        return results
 
     @classmethod
     def _recursive_update(cls, original_dict: Dict, new_dict: Dict, append_list: bool = False) -> Dict:
@@ -145,22 +466,43 @@ class YamlConfigurator:
          [If append_list is True, new list elements in the new dictionary will be appended to the original list.
           Otherwise, it will overwrite the values in the original dictionary.]
         """
-        for key, value in new_dict.items():
-            if isinstance(value, dict):
-                # 如果original_dict中没有key或者key对应的值不是字典类型，则将key对应的值设为空字典。
-                # [if original_dict does not have key or key value is not a dictionary type, set key value to empty dictionary.]
-                if not isinstance(original_dict, dict) or key not in original_dict or not isinstance(original_dict[key],
-                                                                                                     dict):
-                    original_dict[key] = {}
-                cls._recursive_update(original_dict[key], value, append_list)
-            elif isinstance(value, list) and append_list:
-                # 如果original_dict中没有key或者key对应的值不是列表类型，则将key对应的值设为空列表。
-                # [if original_dict does not have key or key value is not a list type, set key value to empty list.]
-                if key not in original_dict or not isinstance(original_dict[key], list):
-                    original_dict[key] = []
-                cls._append_list_items(original_dict[key], value)
+        if _fast_recursive_update is not None and type(original_dict) is dict and type(new_dict) is dict:
+            return _fast_recursive_update(original_dict, new_dict, append_list)
+
+        # 用显式栈代替递归，栈中保存(原始字典, 新字典的项迭代器)，保持深度优先的更新顺序。
+        # [Use an explicit stack instead of recursion. It holds (original dict, iterator over new dict items),
+        #  keeping the depth-first update order.]
+        # active记录当前栈上新字典的id，用于发现循环引用(如YAML递归锚点)。
+        # [active holds the ids of the new dicts currently on the stack, to detect cycles such as recursive YAML anchors.]
+        stack = [(original_dict, iter(new_dict.items()), id(new_dict))]
+        active = {id(new_dict)}
+        while stack:
+            target, items, _ = stack[-1]
+            for key, value in items:
+                # 新字典来自调用方，可能是OrderedDict等子类，因此用isinstance判断。
+                # [new_dict comes from the caller and may hold subclasses such as OrderedDict, hence isinstance.]
+                if isinstance(value, dict):
+                    # 如果target中没有key或者key对应的值不是字典类型，则将key对应的值设为空字典。
+                    # [if target does not have key or key value is not a dictionary type, set key value to empty dictionary.]
+                    if id(value) in active:
+                        raise ValueError(f'Circular reference in the data to update, key: {key}.')
+                    child = target.get(key)
+                    if type(child) is not dict:
+                        child = target[key] = {}
+                    stack.append((child, iter(value.items()), id(value)))
+                    active.add(id(value))
+                    break
+                elif append_list and isinstance(value, list):
+                    # 如果target中没有key或者key对应的值不是列表类型，则将key对应的值设为空列表。
+                    # [if target does not have key or key value is not a list type, set key value to empty list.]
+                    child = target.get(key)
+                    if type(child) is not list:
+                        child = target[key] = []
+                    cls._append_list_items(child, value)
+                else:
+                    target[key] = value
             else:
-                original_dict[key] = value
+                active.discard(stack.pop()[2])
 
         return original_dict
 
@@ -171,6 +513,11 @@ class YamlConfigurator:
         [Append new items to the original list.
         if the items in the original list are of dictionary type, update them recursively.]
         """
+        # 没有字典项时整体追加。 [Without dictionary items, extend the list in one go.]
+        if not any(isinstance(item, dict) for item in new_items):
+            original_list.extend(new_items)
+            return
+
         for item in new_items:
             if isinstance(item, dict):
                 # 如果item是字典类型，递归更新。 [if item is a dictionary type, update recursively.]
@@ -181,7 +528,17 @@ class YamlConfigurator:
                 original_list.append(item)
 
     @property
-    def data(self) -> Dict:
+    def data(self) -> Mapping:
+        """
+        获取数据的只读视图。 [Get a read-only view of the data.]
+        :return: 只读视图，需要可修改的副本时请使用data_copy。 [read-only view, use data_copy for a mutable copy.]
+        """
+        if self._data is None:
+            raise ValueError('Data is not loaded.')
+
+        return types.MappingProxyType(self._data)
+
+    def data_copy(self) -> Dict:
         """
         获取数据副本。 [Get a copy of the data.]
         :return: 数据副本。 [data copy.]
@@ -191,22 +548,30 @@ class YamlConfigurator:
 
         return self._data.copy()
 
-    def safe_load(self, default: Optional[Dict] = None) -> 'YamlConfigurator':
+    def safe_load(self, default: Optional[Dict] = None, cache_file: bool = False) -> 'YamlConfigurator':
         """
         安全加载 YAML 文件。 [Safe load YAML file.]
         :param default: 默认值。 [default value.]
+        :param cache_file: 是否在YAML文件旁读写'.cache.json'缓存文件，文件未变化时跳过YAML解析。
+         [Whether to read/write a '.cache.json' cache file next to the YAML file, skipping YAML parsing when unchanged.]
         :return: YamlConfigurator对象。 [YamlConfigurator object.]
         """
         if self.file_path is None:
             raise ValueError('File path is not specified.')
         
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                self._data = yaml.safe_load(file)
+            # 使用绝对路径作为缓存键，切换工作目录后相对路径不会命中错误的文件。
+            # [Key the cache on the absolute path, so a relative path never hits another file after chdir.]
+            file_path = os.path.abspath(self.file_path)
+            st = os.stat(file_path)
+            # update会原地修改数据，因此需要深拷贝缓存结果。 [update mutates data in place, so the cached result is deep-copied.]
+            self._data = copy.deepcopy(
+                _cached_load(file_path, [st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size], cache_file))
         except FileNotFoundError as e:
             if default is None:
                 raise e
             self._data = default
+        self._last_hash = None
 
         return self
 
@@ -219,6 +584,7 @@ class YamlConfigurator:
 
         self.__write(self.file_path, data, create=ignore_exists == False)
         self._data = data
+        self._last_hash = None
 
     def write(self, data: Dict) -> None:
         """
@@ -229,13 +595,17 @@ class YamlConfigurator:
 
         self.__write(self.file_path, data)
         self._data = data
+        self._last_hash = None
 
-    def update(self, data: Dict, append_list: bool = False) -> None:
+    def update(self, data: Dict, append_list: bool = False, skip_if_unchanged: bool = False) -> None:
         """
         更新 YAML 文件。 [Update YAML file.]
 
         :param data: 要更新的数据。 [Data to be updated.]
         :param append_list: 是否将新项追加到列表中，而不是替换它们。 [Whether to append new items to the list instead of replacing them.]
+        :param skip_if_unchanged: 若更新后的数据与本对象上次写入的数据相同，则跳过写入。其他进程也会写入该文件时不要开启。
+         [Skip writing if the updated data equals the data last written by this object.
+          Do not enable it when other processes also write the file.]
         :return: None
         """
         if self.file_path is None:
@@ -244,14 +614,34 @@ class YamlConfigurator:
             raise ValueError('Data is not loaded.')
 
         new_data = self._recursive_update(self._data, data, append_list)
-        self.__write(self.file_path, new_data)
         self._data = new_data
+        if not skip_if_unchanged:
+            self.__write(self.file_path, new_data)
+            self._last_hash = None
+            return
+
+        new_hash = _fingerprint(new_data)
+        if new_hash != self._last_hash:
+            self.__write(self.file_path, new_data)
+            self._last_hash = new_hash
+
+    @staticmethod
+    def path(dotted: str) -> KeyPath:
+        """
+        将点分隔的键路径拆分为KeyPath，结果会被缓存，可直接传给get和gets。
+        [Split a dotted key path into a KeyPath. The result is cached and can be passed to get and gets directly.]
 
-    def get(self, *args: Union[str, List[str]], return_yc: bool = False, **kwargs) -> Union['YamlConfigurator', Any]:
+        :param dotted: 点分隔的键路径，如'key1.sub_key1'。 [Dotted key path, e.g. 'key1.sub_key1'.]
+        :return: 键路径。 [Key path.]
+        """
+        return _split_path(dotted)
+
+    def get(self, *args: Union[str, List[str], KeyPath], return_yc: bool = False, **kwargs) -> Union['YamlConfigurator', Any]:
         """
         从 YAML 对象中依次获得嵌套键的值。 [YAML object to obtain nested key values in turn.]
 
-        :param args: YAML中的键，用于访问里面嵌套键的值。 [Keys in YAML, used to access the value of nested keys.]
+        :param args: YAML中的键，用于访问里面嵌套键的值；也可以是单个KeyPath(见path)。
+         [Keys in YAML, used to access the value of nested keys; may also be a single KeyPath (see path).]
         :param return_yc: 是否返回YamlConfigurator对象。 [Whether to return YamlConfigurator object.]
         :param kwargs: 可选参数，用于指定默认值(default)。 [Optional parameter, used to specify the default value (default).]
         :return: 键的值。如果不存在则返回默认值，若无默认值则抛出异常。
@@ -260,12 +650,31 @@ class YamlConfigurator:
         """
         if self._data is None:
             raise ValueError('Data is not loaded.')
-            
-        data = self.__get(*args, data=self._data, **kwargs)
+
+        # 单个KeyPath即为完整的键路径。 [A single KeyPath is the whole key path.]
+        if len(args) == 1 and type(args[0]) is KeyPath:
+            args = args[0]
+
+        # 最常见的单个键访问直接查字典。 [The most common case, a single key, is a direct dict lookup.]
+        if len(args) == 1 and not return_yc and type(args[0]) is str:
+            try:
+                return self._data[args[0]]
+            except (KeyError, TypeError):
+                if 'default' in kwargs:
+                    return kwargs['default']
+                raise KeyError(f'Missing configuration parameters: {list(args)}.') from None
+
+        data = self.__get(self._data, args, (), 'default' in kwargs, kwargs.get('default'))
 
         if not return_yc:
             return data
 
+        return self.__as_yc(data)
+
+    def __as_yc(self, data: Any) -> 'YamlConfigurator':
+        """
+        将字典对象转为YamlConfigurator对象。 [Convert a dictionary object to a YamlConfigurator object.]
+        """
         # 字典对象可以转为YamlManager对象。 [Dictionary objects can be converted to YamlManager objects.]
         if not isinstance(data, dict):
             raise TypeError(
@@ -273,7 +682,49 @@ class YamlConfigurator:
 
         return YamlConfigurator(self.file_path, data)
 
-    def gets(self, *args: Union[List, str], return_yc: bool = False, **kwargs) -> Union['YamlConfigurator', Any]:
+    def __get_many(self, args: tuple, return_yc: bool, has_default: bool, defaults: List) -> List:
+        """
+        一次遍历获取多个嵌套键的值。 [Get the values of multiple nested keys in a single pass.]
+
+        :param args: 每项为单个键(str)或键路径(list、KeyPath)。 [Each item is a single key (str) or a key path (list, KeyPath).]
+        :param return_yc: 是否返回YamlConfigurator对象。 [Whether to return YamlConfigurator objects.]
+        :param has_default: 是否存在默认值。 [Whether there is a default value.]
+        :param defaults: 与args一一对应的默认值，无默认值时为None。 [Default values, one per item of args, None without a default.]
+        :return: 各键的值。 [Values of the keys.]
+        """
+        data = self._data
+        results = [None] * len(args)
+        for i, x in enumerate(args):
+            # 单个键直接查字典，缺失时交给_missing处理默认值和错误。
+            # [A single key is a direct dict lookup; on a miss _missing handles the default and the error.]
+            if isinstance(x, str):
+                try:
+                    value = data[x]
+                except (KeyError, TypeError):
+                    value = self._missing(data, (x,), (), has_default, defaults[i])
+                results[i] = self.__as_yc(value) if return_yc else value
+                continue
+
+            if isinstance(x, list):
+                keys = tuple(x)
+            elif isinstance(x, KeyPath):
+                keys = x
+            else:
+                raise TypeError(f'Parameter type error, should be str, list or KeyPath, actual: {type(x)}')
+
+            # 普通键路径直接访问，缺失时交给_missing处理；末尾为列表时交给__get处理。
+            # [Plain key paths are walked directly and a miss goes to _missing; a terminal list goes to __get.]
+            if keys and isinstance(keys[-1], list):
+                value = self.__get(data, keys, (), has_default, defaults[i])
+            else:
+                value = self._get_one(data, keys, _MISSING)
+                if value is _MISSING:
+                    value = self._missing(data, keys, (), has_default, defaults[i])
+            results[i] = self.__as_yc(value) if return_yc else value
+
+        return results
+
+    def gets(self, *args: Union[List, str, KeyPath], return_yc: bool = False, **kwargs) -> Union['YamlConfigurator', Any]:
         """
         从 YAML 对象中依次获得多个嵌套键的值。 [YAML object to obtain multiple nested keys in turn.]
 
@@ -284,12 +735,13 @@ class YamlConfigurator:
          [The value of the key. if it does not exist, return the default value.
           if there is no default value, an exception will be thrown.]
         """
-        results = []
+        if self._data is None:
+            raise ValueError('Data is not loaded.')
 
         # 处理默认值 [Handle default value]
         has_default = 'default' in kwargs
         if not has_default:
-            defaults = []
+            defaults = [None] * len(args)
         else:
             default = kwargs.get('default')
             if isinstance(default, list):
@@ -302,15 +754,7 @@ class YamlConfigurator:
                 defaults = [default] * len(args)
 
         # 获取多个嵌套键的值 [Get multiple nested key values]
-        for (i, x) in enumerate(args):
-            if isinstance(x, list):
-                result = self.get(*x, return_yc=return_yc, **{'default': defaults[i]} if has_default else {})
-            elif isinstance(x, str):
-                result = self.get(x, return_yc=return_yc, **{'default': defaults[i]} if has_default else {})
-            else:
-                raise TypeError(f'Parameter type error, should be str or list, actual: {type(x)}')
-
-            results.append(result)
+        results = self.__get_many(args, return_yc, has_default, defaults)
 
         return results[0] if len(args) == 1 else results
 
@@ -376,10 +820,224 @@ def test_configurator():
         assert isinstance(hobbies, list)
         assert {"name": "swimming", "level": "intermediate"} in hobbies
 
+        # 测试12.1：字典子类(如OrderedDict)的值会被合并而不是整体替换。
+        # [Values that are dict subclasses (e.g. OrderedDict) are merged instead of replacing the whole subtree.]
+        merged = YamlConfigurator._recursive_update({"a": {"x": 1}, "l": [1]},
+                                                    {"a": OrderedDict(y=2), "l": [OrderedDict(z=3)]}, True)
+        assert merged == {"a": {"x": 1, "y": 2}, "l": [1, {"z": 3}]}
+        assert type(merged["a"]) is dict and type(merged["l"][1]) is dict
+
+        # 测试13：文件变化后重新加载得到新内容，修改加载结果不影响缓存。
+        # [Reload after the file changes returns new content; mutating loaded data does not leak into the cache.]
+        YamlConfigurator(file_path).write({"name": "Tom", "age": 40, "tags": ["a"]})
+        yaml_configurator = YamlConfigurator(file_path).safe_load()
+        assert yaml_configurator.get("name") == "Tom"
+        yaml_configurator.get("tags").append("b")
+        assert YamlConfigurator(file_path).safe_load().get("tags") == ["a"]
+
+        # 测试14：data为只读视图，data_copy为可修改副本。 [data is a read-only view, data_copy is a mutable copy.]
+        try:
+            yaml_configurator.data["name"] = "Bob"
+            assert False
+        except TypeError:
+            pass
+        data = yaml_configurator.data_copy()
+        data["name"] = "Bob"
+        assert yaml_configurator.get("name") == "Tom"
+
+        # 测试15：数据未变化时跳过写入。 [Skip writing when the data is unchanged.]
+        yaml_configurator.update({"name": "Tom"}, skip_if_unchanged=True)
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        yaml_configurator.update({"name": "Tom"}, skip_if_unchanged=True)
+        assert os.stat(file_path).st_mtime_ns == mtime_ns
+        yaml_configurator.update({"name": "Ann"}, skip_if_unchanged=True)
+        assert YamlConfigurator(file_path).safe_load().get("name") == "Ann"
+
+        # 测试16：点分隔的键路径。 [Dotted key path.]
+        yaml_configurator.update({"address": {"city": "Boston"}})
+        assert YamlConfigurator.path("address.city") is YamlConfigurator.path("address.city")
+        assert yaml_configurator.get(YamlConfigurator.path("address.city")) == "Boston"
+        assert yaml_configurator.gets(YamlConfigurator.path("address.city"), "name") == ["Boston", "Ann"]
+        # 普通元组仍作为单个键。 [A plain tuple is still a single key.]
+        assert YamlConfigurator(data={("address", "city"): "tuple key"}).get(("address", "city")) == "tuple key"
+        assert yaml_configurator.get(("address", "city"), default=None) is None
+
+        # 测试17：JSON缓存文件。 [JSON cache file.]
+        _PARSE_CACHE.clear()
+        data = YamlConfigurator(file_path).safe_load(cache_file=True).data_copy()
+        assert os.path.exists(file_path + _CACHE_FILE_SUFFIX)
+        _PARSE_CACHE.clear()
+        assert YamlConfigurator(file_path).safe_load(cache_file=True).data_copy() == data
+        yaml_configurator.update({"name": "Max"})
+        assert not os.path.exists(file_path + _CACHE_FILE_SUFFIX)
+        assert YamlConfigurator(file_path).safe_load(cache_file=True).get("name") == "Max"
+        # 其他程序以相同大小和修改时间改写文件后，缓存文件失效。
+        # [The cache file is invalid after another program rewrites the file with the same size and mtime.]
+        st = os.stat(file_path)
+        with open(file_path, 'r', encoding='utf-8') as file:
+            text = file.read()
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(text.replace("Max", "Mia"))
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        _PARSE_CACHE.clear()
+        assert YamlConfigurator(file_path).safe_load(cache_file=True).get("name") == "Mia"
+
+        # 测试18：通过符号链接写入时写入真实文件。 [Writing through a symlink updates the real file.]
+        if hasattr(os, "symlink"):
+            link_path = file_path + ".link"
+            os.symlink(os.path.abspath(file_path), link_path)
+            try:
+                YamlConfigurator(link_path).safe_load().update({"name": "Lin"})
+                assert os.path.islink(link_path)
+                assert YamlConfigurator(file_path).safe_load().get("name") == "Lin"
+            finally:
+                os.remove(link_path)
+
+        # 测试19：文件内容变化但大小和修改时间不变时，不返回过期的缓存。
+        # [Stale cache is not served when the content changes but size and mtime stay the same.]
+        yaml_configurator.write({"k": "aaa"})
+        assert YamlConfigurator(file_path).safe_load().get("k") == "aaa"
+        st = os.stat(file_path)
+        yaml_configurator.write({"k": "bbb"})
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert os.stat(file_path).st_size == st.st_size
+        assert YamlConfigurator(file_path).safe_load().get("k") == "bbb"
+
+        # 测试20：编译的合并实现与纯Python实现结果一致，且能处理嵌套很深的字典。
+        # [The compiled merge matches the pure-Python one and handles deeply nested dictionaries.]
+        global _fast_recursive_update
+        fast_recursive_update = _fast_recursive_update
+        cases = [
+            ({"a": {"x": 1, "l": [1]}, "b": 2}, {"a": {"y": {"z": 3}, "l": [2, {"k": [4]}]}, "b": {"c": 1}}),
+            ({"a": 1, "l": [{"k": 1}]}, {"a": OrderedDict(y=2), "l": [OrderedDict(z=[3])], "n": None}),
+            ({}, {"a": {"b": {"c": [1, 2]}}, "d": []}),
+        ]
+        try:
+            for original, new in cases:
+                for append_list in (False, True):
+                    _fast_recursive_update = fast_recursive_update
+                    fast_result = YamlConfigurator._recursive_update(copy.deepcopy(original), new, append_list)
+                    _fast_recursive_update = None
+                    pure_result = YamlConfigurator._recursive_update(copy.deepcopy(original), new, append_list)
+                    assert fast_result == pure_result
+        finally:
+            _fast_recursive_update = fast_recursive_update
+
+        # 循环引用的更新数据会报错，而不是无限展开；共享但不循环的对象可以正常合并。
+        # [Update data with a cycle raises instead of expanding forever; shared but acyclic objects merge normally.]
+        cyclic = yaml.safe_load("a: &x\n  b: *x\n")
+        shared = {"x": 1}
+        try:
+            for fast in (fast_recursive_update, None):
+                _fast_recursive_update = fast
+                try:
+                    YamlConfigurator._recursive_update({}, cyclic)
+                    assert False
+                except ValueError:
+                    pass
+                assert YamlConfigurator._recursive_update({}, {"a": shared, "b": {"c": shared}}) == \
+                       {"a": {"x": 1}, "b": {"c": {"x": 1}}}
+        finally:
+            _fast_recursive_update = fast_recursive_update
+
+        deep = leaf = {}
+        for _ in range(200000):
+            leaf["k"] = {}
+            leaf = leaf["k"]
+        merged = YamlConfigurator._recursive_update({}, deep)
+        for _ in range(200000):
+            merged = merged["k"]
+        assert merged == {}
+
+        # 测试21：创建已存在的文件时报错；创建时写入失败会删除占用的空文件；覆盖写入失败时保留原内容和权限。
+        # [Creating an existing file raises; a failed dump on create removes the claimed empty file;
+        #  a failed overwrite keeps the original content and mode.]
+        try:
+            YamlConfigurator(file_path).create({"name": "Eve"})
+            assert False
+        except FileExistsError:
+            pass
+
+        new_path = file_path + ".new"
+        try:
+            YamlConfigurator(new_path).create({"bad": object()})
+            assert False
+        except yaml.YAMLError:
+            pass
+        assert not os.path.exists(new_path)
+
+        yaml_configurator.write({"name": "Kim"})
+        os.chmod(file_path, 0o640)
+        with open(file_path, 'r', encoding='utf-8') as file:
+            text = file.read()
+        try:
+            yaml_configurator.write({"bad": object()})
+            assert False
+        except yaml.YAMLError:
+            pass
+        with open(file_path, 'r', encoding='utf-8') as file:
+            assert file.read() == text
+        if os.name == "posix":
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
+        directory = os.path.dirname(os.path.abspath(file_path))
+        assert not [f for f in os.listdir(directory) if f.startswith(f".{os.path.basename(file_path)}.")]
+
+        # 测试14.1：调用方传入的列表子类同样可以作为最后一个参数访问多个子键。
+        # [A list subclass passed by the caller also works as the last parameter to fetch several sub-keys.]
+        class KeyList(list):
+            pass
+        yaml_configurator = YamlConfigurator(data={"a": {"x": 1, "y": 2}})
+        assert yaml_configurator.get("a", KeyList(["x", "y"])) == [1, 2]
+        assert yaml_configurator.gets(["a", KeyList(["x", KeyList(["y"])])]) == [1, [2]]
+
+        # 测试22：加载后的键被驻留，YAML锚点共享的对象仍然共享。
+        # [Loaded keys are interned, and objects shared through YAML anchors stay shared.]
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write("name: Zoe\nbase: &base {city: Paris}\nhome: *base\n")
+        yaml_configurator = YamlConfigurator(file_path).safe_load()
+        assert next(iter(yaml_configurator.data)) is sys.intern("name")
+        assert yaml_configurator.get("home") is yaml_configurator.get("base")
+        assert next(iter(yaml_configurator.get("home"))) is sys.intern("city")
+
+        # 测试23：文件反复改写后，每个路径只保留一项解析缓存。 [Only one parse cache entry per path after repeated rewrites.]
+        _PARSE_CACHE.clear()
+        for i in range(5):
+            YamlConfigurator(file_path).safe_load().update({"count": i})
+        assert list(_PARSE_CACHE) == [os.path.abspath(file_path)]
+
+        # 测试24：gets的默认值列表、长度不匹配、缺失键、末尾列表和return_yc。
+        # [gets with a default list, a length mismatch, a missing key, a terminal list and return_yc.]
+        yaml_configurator = YamlConfigurator(data={"name": "Ivy", "address": {"city": "Rome", "zip": "00100"}})
+        assert yaml_configurator.gets("name", ["address", "state"], "age", default=["-", "RM", 0]) == ["Ivy", "RM", 0]
+        try:
+            yaml_configurator.gets("name", "age", default=["-"])
+            assert False
+        except ValueError:
+            pass
+        try:
+            yaml_configurator.gets("name", ["address", "state"])
+            assert False
+        except KeyError:
+            pass
+        assert yaml_configurator.gets(["address", ["city", "zip"]], "name") == [["Rome", "00100"], "Ivy"]
+        assert yaml_configurator.gets(["address", ["city", "state"]], default="?") == ["Rome", "?"]
+        address = yaml_configurator.gets("address", return_yc=True)
+        assert isinstance(address, YamlConfigurator) and address.get("city") == "Rome"
+        try:
+            yaml_configurator.gets("address", "name", return_yc=True)
+            assert False
+        except TypeError:
+            pass
+
+        # 测试25：支持弱引用。 [Weak references are supported.]
+        assert weakref.ref(yaml_configurator)() is yaml_configurator
+
         print("All test cases pass.")
     finally:
         # 删除临时文件。 [Delete temporary file.]
         os.remove(file_path)
+        if os.path.exists(file_path + _CACHE_FILE_SUFFIX):
+            os.remove(file_path + _CACHE_FILE_SUFFIX)
 
 
 if __name__ == "__main__":